@@ -0,0 +1,76 @@
+"""Background tracking of pending database migrations.
+
+Readiness probes read ``STATUS`` instead of inspecting the migration plan on
+every request. A daemon thread keeps it up to date, re-checking often while
+migrations are pending so a freshly migrated deployment turns ready quickly.
+"""
+
+import threading
+import time
+from datetime import UTC, datetime
+from typing import Any
+
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+
+# Seconds between background checks, depending on the last outcome.
+REFRESH_INTERVAL = 30
+PENDING_REFRESH_INTERVAL = 5
+
+# ``state`` moves from "unknown" to "running" on each check, then to
+# "succeeded" (``pending`` holds the result) or "failed" (``error`` says why,
+# and stays set until a later check succeeds).
+STATUS: dict[str, Any] = {
+    "state": "unknown",
+    "last_checked": None,
+    "pending": None,
+    "error": None,
+}
+
+_lock = threading.Lock()
+_started = threading.Event()
+
+
+def _has_pending_migrations() -> bool:
+    executor = MigrationExecutor(connection)
+    targets = executor.loader.graph.leaf_nodes()
+    return bool(executor.migration_plan(targets))
+
+
+def refresh() -> None:
+    """Check for pending migrations and record the outcome in ``STATUS``."""
+    STATUS["state"] = "running"
+    try:
+        pending = _has_pending_migrations()
+    except (ConnectionError, Exception) as e:
+        STATUS.update(state="failed", error=str(e))
+    else:
+        STATUS.update(state="succeeded", pending=pending, error=None)
+    STATUS["last_checked"] = datetime.now(UTC).isoformat()
+
+
+def _run() -> None:
+    while True:
+        unresolved = STATUS["pending"] or STATUS["state"] == "failed"
+        time.sleep(PENDING_REFRESH_INTERVAL if unresolved else REFRESH_INTERVAL)
+        try:
+            refresh()
+        finally:
+            connection.close()
+
+
+def ensure_started() -> None:
+    """Populate ``STATUS`` and start the refresh thread, once per process.
+
+    The thread is started lazily from the first readiness probe rather than at
+    app load, so management commands never spawn it; a test run only does if
+    it calls the readiness endpoint.
+    """
+    if _started.is_set():
+        return
+    with _lock:
+        if _started.is_set():
+            return
+        refresh()
+        threading.Thread(target=_run, name="migration-status", daemon=True).start()
+        _started.set()
@@ -0,0 +1,29 @@
+"""Response schemas for core API endpoints."""
+
+from ninja import Schema
+
+
+class HealthOut(Schema):
+    status: str
+    service: str
+    version: str
+    timestamp: str
+
+
+class DbHealthOut(Schema):
+    database: str
+    error: str | None
+    timestamp: str
+
+
+class CacheHealthOut(Schema):
+    cache: str
+    error: str | None
+    timestamp: str
+
+
+class ReadinessOut(Schema):
+    ready: bool
+    checks: dict[str, bool]
+    errors: dict[str, str] | None
+    timestamp: str
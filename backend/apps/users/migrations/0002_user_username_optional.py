@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-14 03:55
+
+import django.contrib.auth.validators
+from django.db import migrations, models
+
+import apps.users.models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("users", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name="user",
+            managers=[
+                ("objects", apps.users.models.UserManager()),
+            ],
+        ),
+        migrations.AlterField(
+            model_name="user",
+            name="username",
+            field=models.CharField(
+                blank=True,
+                help_text="Optional. 150 characters or fewer. Letters, digits and @/./+/-/_ only.",
+                max_length=150,
+                validators=[django.contrib.auth.validators.UnicodeUsernameValidator()],
+            ),
+        ),
+    ]
@@ -1,20 +1,132 @@
 """User models."""
 
-from typing import ClassVar
+from typing import Any, ClassVar
 
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import AbstractUser
+from django.contrib.auth.models import UserManager as DjangoUserManager
 from django.db import models
 
 
+class UserManager(DjangoUserManager["User"]):
+    """Manager for users identified by email rather than username.
+
+    Only user creation is overridden; ``with_perm()`` and the rest of Django's
+    manager are inherited unchanged.
+    """
+
+    def _create_user_object(
+        self,
+        email: str,
+        password: str | None,
+        **extra_fields: Any,  # noqa: ANN401
+    ) -> "User":
+        if not email:
+            msg = "The given email must be set"
+            raise ValueError(msg)
+        user = self.model(email=self.normalize_email(email), **extra_fields)
+        user.password = make_password(password)
+        return user
+
+    def _create_user(
+        self,
+        email: str,
+        password: str | None,
+        **extra_fields: Any,  # noqa: ANN401
+    ) -> "User":
+        user = self._create_user_object(email, password, **extra_fields)
+        user.save(using=self._db)
+        return user
+
+    async def _acreate_user(
+        self,
+        email: str,
+        password: str | None,
+        **extra_fields: Any,  # noqa: ANN401
+    ) -> "User":
+        user = self._create_user_object(email, password, **extra_fields)
+        await user.asave(using=self._db)
+        return user
+
+    @staticmethod
+    def _superuser_fields(extra_fields: dict[str, Any]) -> dict[str, Any]:
+        extra_fields.setdefault("is_staff", True)
+        extra_fields.setdefault("is_superuser", True)
+
+        if extra_fields.get("is_staff") is not True:
+            msg = "Superuser must have is_staff=True."
+            raise ValueError(msg)
+        if extra_fields.get("is_superuser") is not True:
+            msg = "Superuser must have is_superuser=True."
+            raise ValueError(msg)
+        return extra_fields
+
+    def create_user(  # type: ignore[override]
+        self,
+        email: str,
+        password: str | None = None,
+        **extra_fields: Any,  # noqa: ANN401
+    ) -> "User":
+        extra_fields.setdefault("is_staff", False)
+        extra_fields.setdefault("is_superuser", False)
+        return self._create_user(email, password, **extra_fields)
+
+    create_user.alters_data = True  # type: ignore[attr-defined]
+
+    async def acreate_user(  # type: ignore[override]
+        self,
+        email: str,
+        password: str | None = None,
+        **extra_fields: Any,  # noqa: ANN401
+    ) -> "User":
+        extra_fields.setdefault("is_staff", False)
+        extra_fields.setdefault("is_superuser", False)
+        return await self._acreate_user(email, password, **extra_fields)
+
+    acreate_user.alters_data = True  # type: ignore[attr-defined]
+
+    def create_superuser(  # type: ignore[override]
+        self,
+        email: str,
+        password: str | None = None,
+        **extra_fields: Any,  # noqa: ANN401
+    ) -> "User":
+        extra_fields = self._superuser_fields(extra_fields)
+        return self._create_user(email, password, **extra_fields)
+
+    create_superuser.alters_data = True  # type: ignore[attr-defined]
+
+    async def acreate_superuser(  # type: ignore[override]
+        self,
+        email: str,
+        password: str | None = None,
+        **extra_fields: Any,  # noqa: ANN401
+    ) -> "User":
+        extra_fields = self._superuser_fields(extra_fields)
+        return await self._acreate_user(email, password, **extra_fields)
+
+    acreate_superuser.alters_data = True  # type: ignore[attr-defined]
+
+
 class User(AbstractUser):
     """Custom user model extending Django's AbstractUser."""
 
+    # Users log in by email, so username is optional and not unique; this also
+    # drops the unique index AbstractUser puts on it.
+    username = models.CharField(
+        max_length=150,
+        blank=True,
+        help_text="Optional. 150 characters or fewer. Letters, digits and @/./+/-/_ only.",
+        validators=[AbstractUser.username_validator],
+    )
     email = models.EmailField(unique=True)
     first_name = models.CharField(max_length=30)
     last_name = models.CharField(max_length=30)
 
+    objects: ClassVar[UserManager] = UserManager()
+
     USERNAME_FIELD = "email"
-    REQUIRED_FIELDS: ClassVar[list[str]] = ["username", "first_name", "last_name"]
+    REQUIRED_FIELDS: ClassVar[list[str]] = ["first_name", "last_name"]
 
     class Meta:
         db_table = "users_user"
@@ -1,7 +1,11 @@
 """Main API configuration for Django Ninja."""
 
+from typing import Any
+
+import orjson
 from django.http import HttpRequest, HttpResponse
 from ninja import NinjaAPI
+from ninja.renderers import JSONRenderer
 from ninja.security import HttpBearer
 
 from apps.core.api import router as core_router
@@ -20,6 +24,32 @@ def authenticate(self, request: HttpRequest, token: str) -> str | None:  # noqa:
         return None
 
 
+class ORJSONRenderer(JSONRenderer):
+    """Render JSON with orjson, encoding the same values as ``JSONRenderer``.
+
+    Datetimes are passed through to Ninja's encoder so they keep Django's
+    format, and anything orjson cannot encode at all (such as integers wider
+    than 64 bits) falls back to the stock renderer.
+    """
+
+    options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+    def __init__(self) -> None:
+        self._default = self.encoder_class().default
+
+    def render(
+        self,
+        request: HttpRequest,
+        data: Any,  # noqa: ANN401
+        *,
+        response_status: int,
+    ) -> bytes | str:
+        try:
+            return orjson.dumps(data, default=self._default, option=self.options)
+        except orjson.JSONEncodeError:
+            return super().render(request, data, response_status=response_status)
+
+
 # Create API instance
 api = NinjaAPI(
     title="AI Project API",
@@ -28,6 +58,7 @@ def authenticate(self, request: HttpRequest, token: str) -> str | None:  # noqa:
     docs_url="/docs",
     openapi_url="/openapi.json",
     urls_namespace="api",
+    renderer=ORJSONRenderer(),
 )
 
 # Register routers
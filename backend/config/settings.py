@@ -29,8 +29,10 @@
 ]
 
 MIDDLEWARE = [
-    "django.middleware.security.SecurityMiddleware",
+    # First, so CORS headers are added even to responses that middleware below
+    # short-circuits (e.g. SecurityMiddleware's HTTPS redirect).
     "corsheaders.middleware.CorsMiddleware",
+    "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -61,7 +63,25 @@
 
 # Database
 DATABASE_URL = config("DATABASE_URL", default="sqlite:///db.sqlite3")
-DATABASES = {"default": dj_database_url.parse(DATABASE_URL, conn_max_age=600)}
+# Persistent connections are health-checked by Django before reuse, so a
+# connection dropped by the server is replaced instead of failing the request.
+DATABASES = {
+    "default": dj_database_url.parse(
+        DATABASE_URL, conn_max_age=600, conn_health_checks=True
+    )
+}
+if DATABASES["default"]["ENGINE"] == "django.db.backends.postgresql":
+    # Fail fast when Postgres is unreachable instead of waiting for the OS TCP
+    # timeout, which would tie up workers (and health probes) for its duration.
+    DATABASES["default"].setdefault("OPTIONS", {})["connect_timeout"] = config(
+        "DB_CONNECT_TIMEOUT", default=2, cast=int
+    )
+    # Set when connecting through PgBouncer in transaction pooling mode, where
+    # consecutive transactions may land on different server connections and
+    # server-side cursors would be lost between them.
+    DATABASES["default"]["DISABLE_SERVER_SIDE_CURSORS"] = config(
+        "DB_TRANSACTION_POOLING", default=False, cast=bool
+    )
 
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
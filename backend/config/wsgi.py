@@ -9,7 +9,12 @@
 import os
 
 from django.core.wsgi import get_wsgi_application
+from django.urls import get_resolver
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
 application = get_wsgi_application()
+
+# Load the URLconf, and with it the Ninja API routes, at startup instead of on
+# the first request, which is usually a health probe.
+get_resolver().url_patterns  # noqa: B018
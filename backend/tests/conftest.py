@@ -4,6 +4,7 @@
 from typing import TYPE_CHECKING, Any
 
 import pytest
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from ninja.testing import TestClient
 
@@ -15,9 +16,22 @@
 User = get_user_model()
 
 
-@pytest.fixture
+def pytest_configure(config: pytest.Config) -> None:
+    """Use a fast password hasher; only the test runner gets this setting.
+
+    The default PBKDF2 hasher is deliberately slow, which makes every user
+    fixture cost tens of milliseconds.
+    """
+    settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+
+@pytest.fixture(scope="session")
 def api_client() -> TestClient:
-    """Create a test client for API testing."""
+    """Create a test client for API testing.
+
+    Shared by the whole session: the client keeps no state between requests,
+    and it caches the API's URL patterns after building them once.
+    """
     from config.api_config import api
 
     return TestClient(api)
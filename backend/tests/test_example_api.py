@@ -1,11 +1,19 @@
 """Example API tests to demonstrate testing patterns."""
 # ruff: noqa: S101, ANN401, ARG002
 
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any
+from unittest.mock import Mock
 
 import pytest
+import redis
+
+from apps.core import api, migration_status
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from django.contrib.auth.models import AbstractUser
     from django.test import Client
 
@@ -30,6 +38,88 @@ def test_db_health_check(self, api_client: "Client", db: Any) -> None:
         assert response.status_code == HTTP_200_OK
         assert response.json()["database"] == "connected"
 
+    def test_cache_health_check(
+        self, api_client: "Client", monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test cache health check against a reachable Redis."""
+        monkeypatch.setattr(api, "_REDIS", Mock(**{"ping.return_value": True}))
+        response = api_client.get("/health/cache/")
+        assert response.status_code == HTTP_200_OK
+        assert response.json()["cache"] == "connected"
+        assert response.json()["error"] is None
+
+    def test_cache_health_check_error(
+        self, api_client: "Client", monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test cache health check when Redis is unreachable."""
+        down = Mock(**{"ping.side_effect": redis.ConnectionError("Redis is down")})
+        monkeypatch.setattr(api, "_REDIS", down)
+        response = api_client.get("/health/cache/")
+        assert response.status_code == HTTP_200_OK
+        assert response.json()["cache"] == "error"
+        assert response.json()["error"] == "Redis is down"
+
+    def test_readiness_check(
+        self, api_client: "Client", db: Any, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test readiness check."""
+        monkeypatch.setattr(api, "_REDIS", Mock(**{"ping.return_value": True}))
+        monkeypatch.setattr(migration_status, "ensure_started", lambda: None)
+        monkeypatch.setattr(
+            migration_status,
+            "STATUS",
+            {
+                "state": "succeeded",
+                "last_checked": None,
+                "pending": False,
+                "error": None,
+            },
+        )
+        response = api_client.get("/health/ready/")
+        assert response.status_code == HTTP_200_OK
+        assert response.json()["ready"] is True
+
+    def test_readiness_check_slow_check(
+        self, api_client: "Client", monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a hung check times out and queued checks are cancelled."""
+        called = []
+
+        def slow_cache_ping() -> None:
+            time.sleep(0.5)
+
+        def record(name: str) -> "Callable[[], None]":
+            return lambda: called.append(name)
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        monkeypatch.setattr(api, "_READINESS_EXECUTOR", executor)
+        monkeypatch.setattr(api, "READINESS_TIMEOUT", 0.1)
+        monkeypatch.setattr(api, "_db_ping", record("database"))
+        monkeypatch.setattr(api, "_cache_ping", slow_cache_ping)
+        monkeypatch.setattr(api, "_migrations_pending", record("migrations"))
+
+        data = api_client.get("/health/ready/").json()
+        executor.shutdown(wait=True)
+
+        assert data["ready"] is False
+        assert data["checks"]["database"] is True
+        assert "timed out" in data["errors"]["cache"]
+        assert "not started" in data["errors"]["migrations"]
+        assert called == ["database"]
+
+    def test_health_check_skips_api_auth(self) -> None:
+        """Test health routes opt out of any API-level auth."""
+        # An explicit ``auth=None`` on the router overrides NinjaAPI(auth=...)
+        # for every operation mounted through it.
+        assert api.router.auth is None
+        operations = [
+            operation
+            for path_view in api.router.path_operations.values()
+            for operation in path_view.operations
+        ]
+        assert operations
+        assert all(not operation.auth_callbacks for operation in operations)
+
 
 class TestUserAPI:
     """Test user-related API endpoints."""
@@ -0,0 +1,79 @@
+"""Tests for background migration status tracking."""
+
+from collections.abc import Iterator
+
+import pytest
+from django.db import connection
+from django.db.migrations.loader import MigrationLoader
+
+from apps.core import api, migration_status
+
+
+@pytest.fixture(autouse=True)
+def _restore_status() -> Iterator[None]:
+    saved = dict(migration_status.STATUS)
+    yield
+    migration_status.STATUS.update(saved)
+
+
+@pytest.mark.django_db
+def test_refresh_records_applied_migrations() -> None:
+    """Test a refresh against a fully migrated database."""
+    migration_status.refresh()
+    assert migration_status.STATUS["state"] == "succeeded"
+    assert migration_status.STATUS["pending"] is False
+    assert migration_status.STATUS["last_checked"] is not None
+
+
+@pytest.mark.django_db
+def test_refresh_records_pending_migrations() -> None:
+    """Test a refresh after a migration has been marked unapplied."""
+    app, name = MigrationLoader(connection).graph.leaf_nodes("users")[0]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "DELETE FROM django_migrations WHERE app = %s AND name = %s",
+            [app, name],
+        )
+    migration_status.refresh()
+    assert migration_status.STATUS["state"] == "succeeded"
+    assert migration_status.STATUS["pending"] is True
+
+
+def test_refresh_records_failure(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test a refresh whose check raises."""
+
+    def broken() -> bool:
+        msg = "database unavailable"
+        raise ConnectionError(msg)
+
+    monkeypatch.setattr(migration_status, "_has_pending_migrations", broken)
+    migration_status.refresh()
+    assert migration_status.STATUS["state"] == "failed"
+    assert migration_status.STATUS["error"] == "database unavailable"
+
+
+@pytest.mark.parametrize(
+    ("status", "expected"),
+    [
+        ({"state": "succeeded", "pending": False, "error": None}, None),
+        (
+            {"state": "succeeded", "pending": True, "error": None},
+            "Pending migrations detected",
+        ),
+        ({"state": "failed", "pending": None, "error": "boom"}, "boom"),
+        ({"state": "running", "pending": None, "error": "boom"}, "boom"),
+        (
+            {"state": "running", "pending": None, "error": None},
+            "Migration status not yet known",
+        ),
+    ],
+)
+def test_readiness_maps_status(
+    monkeypatch: pytest.MonkeyPatch,
+    status: dict[str, object],
+    expected: str | None,
+) -> None:
+    """Test how the readiness check reports each migration status."""
+    monkeypatch.setattr(migration_status, "ensure_started", lambda: None)
+    migration_status.STATUS.update(status)
+    assert api._migrations_pending() == expected  # noqa: SLF001
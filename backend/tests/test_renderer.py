@@ -0,0 +1,30 @@
+"""Tests for the orjson API renderer."""
+
+import json
+import uuid
+from datetime import UTC, date, datetime
+from decimal import Decimal
+
+import pytest
+from django.test import RequestFactory
+from ninja.renderers import JSONRenderer
+
+from config.api_config import ORJSONRenderer
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"status": "healthy", "checks": {"database": True}, "errors": None},
+        {"at": datetime(2024, 1, 1, 1, 2, 3, 123456, tzinfo=UTC)},
+        {"day": date(2024, 1, 1), "id": uuid.UUID(int=1), "price": Decimal("1.10")},
+        {1: "a", 2: ["b", 3.5]},
+        {"big": 2**70},
+    ],
+)
+def test_matches_stock_renderer(data: object) -> None:
+    """Test the orjson renderer output decodes the same as the stock one."""
+    request = RequestFactory().get("/")
+    ours = ORJSONRenderer().render(request, data, response_status=200)
+    stock = JSONRenderer().render(request, data, response_status=200)
+    assert json.loads(ours) == json.loads(stock)
@@ -0,0 +1,43 @@
+"""Tests for the custom user model and manager."""
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+def test_create_user_without_username() -> None:
+    """Test users are keyed by email and need no (or a unique) username."""
+    first = User.objects.create_user(email="First@Example.com", password="pass12345")
+    second = User.objects.create_user(email="second@example.com")
+
+    assert first.username == second.username == ""
+    assert first.email == "First@example.com"
+    assert first.check_password("pass12345")
+    assert not second.has_usable_password()
+
+
+@pytest.mark.django_db
+def test_create_superuser() -> None:
+    """Test superusers get staff and superuser flags."""
+    admin = User.objects.create_superuser(email="root@example.com", password="x")
+    assert admin.is_staff
+    assert admin.is_superuser
+
+
+@pytest.mark.django_db(transaction=True)
+def test_acreate_superuser() -> None:
+    """Test the async creation methods are keyed by email too."""
+    admin = async_to_sync(User.objects.acreate_superuser)(
+        email="async@example.com", password="x"
+    )
+    assert admin.is_superuser
+    assert User.objects.get(email="async@example.com").check_password("x")
+
+
+def test_create_user_requires_email() -> None:
+    """Test a user cannot be created without an email."""
+    with pytest.raises(ValueError, match="email must be set"):
+        User.objects.create_user(email="")